@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import ast
 import asyncio
-import datetime
 import logging
-import threading
-from typing import TYPE_CHECKING, Any
+import operator
+import re
+import sys
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
 
-import homeassistant.util.dt as dt_util
 import voluptuous as vol
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import (
@@ -26,6 +30,7 @@ from homeassistant.const import (
     CONF_TARGET,
     CONF_THEN,
     ENTITY_MATCH_ALL,
+    ENTITY_MATCH_NONE,
 )
 from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import (
@@ -48,6 +53,10 @@ from homeassistant.helpers.service import async_extract_referenced_entity_ids
 from homeassistant.helpers.template import Template, result_as_boolean
 
 if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Callable, Iterable, Mapping
+
+    from homeassistant.core import Service
     from homeassistant.helpers.entity import Entity
     from homeassistant.helpers.typing import ConfigType
 
@@ -75,28 +84,64 @@ DEFAULT_BACKOFF = "{{ 2 ** attempt }}"
 DEFAULT_RETRIES = 7
 DEFAULT_STATE_GRACE = 0.2
 GROUP_DOMAIN = "group"
+DOMAIN_ACTION_SERVICE = f"{DOMAIN}.{ACTION_SERVICE}"
+DOMAIN_ACTIONS_SERVICE = f"{DOMAIN}.{ACTIONS_SERVICE}"
+DOMAIN_CALL_SERVICE = f"{DOMAIN}.{CALL_SERVICE}"
+ENTITY_SERVICE_FIELDS = frozenset(key.schema for key in cv.ENTITY_SERVICE_FIELDS)
+DISALLOWED_INNER_SERVICES = frozenset({DOMAIN_ACTION_SERVICE, DOMAIN_CALL_SERVICE})
+
+_BACKOFF_OPERATORS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_BACKOFF_VARIABLE = "attempt"
+_BACKOFF_EXPRESSION_RE = re.compile(r"\{\{(.*)\}\}", re.DOTALL)
 
+# Accessed only from the event loop, so no locking is required.
 _running_retries: dict[str, tuple[str, int]] = {}
-_running_retries_write_lock = threading.Lock()
+_NOT_RUNNING = (None, 0)
+_NO_ENTITY_COMPONENTS: Mapping[str, EntityComponent] = MappingProxyType({})
+
+_DIGITS = r"\d(?:_?\d)*"
+# Pre-filter for float()'s syntax, so typical non-numeric states skip the exception.
+_FLOAT_RE = re.compile(
+    rf"\s*[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)\s*",
+    re.IGNORECASE,
+)
+
+_TEMPLATE_TOKENS = {
+    "[[": "{{",
+    "]]": "}}",
+    "[%": "{%",
+    "%]": "%}",
+    "[#": "{#",
+    "#]": "#}",
+}
+_TEMPLATE_TOKENS_RE = re.compile("|".join(map(re.escape, _TEMPLATE_TOKENS)))
 
 
 def _template_parameter(value: Any) -> str:
     """Render template parameter."""
+    if isinstance(value, str) and "{" not in value:
+        # Static string (e.g. an already rendered action name) renders to itself.
+        return value
     return cv.template(value).async_render(parse_result=False)
 
 
+@lru_cache(maxsize=256)
 def _fix_template_tokens(value: str) -> str:
     """Replace template's artificial tokens brackets with Jinja's valid tokens."""
-    for artificial, valid in {
-        "[[": "{{",
-        "]]": "}}",
-        "[%": "{%",
-        "%]": "%}",
-        "[#": "{#",
-        "#]": "#}",
-    }.items():
-        value = value.replace(artificial, valid)
-    return value
+    if "[" not in value and "]" not in value:
+        return value
+    return _TEMPLATE_TOKENS_RE.sub(
+        lambda match: _TEMPLATE_TOKENS[match.group(0)], value
+    )
 
 
 def _backoff_parameter(value: Any | None) -> str | None:
@@ -115,19 +160,43 @@ def _validation_parameter(value: Any | None) -> str | None:
     return value
 
 
-def _rename_legacy_service_key(value: Any | None) -> Any:
-    if isinstance(value, dict) and ATTR_SERVICE in value:
-        value[CONF_ACTION] = value.pop(ATTR_SERVICE)
-        LOGGER.log(
-            logging.WARNING,
-            (
-                "'service: %s' should be renamed to 'action: %s'. "
-                "Support for the deprecated 'service' field will be removed "
-                "in a future release."
-            ),
-            value[CONF_ACTION],
-            value[CONF_ACTION],
-        )
+def _float_or_none(value: Any) -> float | None:
+    """Convert the value to float (or None when it's not a number)."""
+    if isinstance(value, int | float):
+        return float(value)
+    if not isinstance(value, str) or not _FLOAT_RE.fullmatch(value):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        # The pattern is looser in a few corners (e.g. "\s" vs. float's whitespace).
+        return None
+
+
+def _normalize_action_key(value: Any | None) -> Any:
+    """Check there is exactly one of 'service' or 'action' and rename the former."""
+    if not isinstance(value, dict):
+        message = "expected dictionary"
+        raise vol.Invalid(message)
+    match (ATTR_SERVICE in value, CONF_ACTION in value):
+        case (False, False):
+            message = f"must contain at least one of {ATTR_SERVICE}, {CONF_ACTION}."
+            raise vol.Invalid(message)
+        case (True, True):
+            message = f"must contain at most one of {ATTR_SERVICE}, {CONF_ACTION}."
+            raise vol.Invalid(message)
+        case (True, False):
+            value[CONF_ACTION] = value.pop(ATTR_SERVICE)
+            LOGGER.log(
+                logging.WARNING,
+                (
+                    "'service: %s' should be renamed to 'action: %s'. "
+                    "Support for the deprecated 'service' field will be removed "
+                    "in a future release."
+                ),
+                value[CONF_ACTION],
+                value[CONF_ACTION],
+            )
     return value
 
 
@@ -142,6 +211,7 @@ SERVICE_SCHEMA_BASE_FIELDS = {
     vol.Optional(ATTR_ON_ERROR): cv.SCRIPT_SCHEMA,
     vol.Optional(ATTR_REPAIR): cv.boolean,
 }
+SERVICE_SCHEMA_BASE_KEYS = frozenset(key.schema for key in SERVICE_SCHEMA_BASE_FIELDS)
 ACTION_SERVICE_PARAMS = vol.Schema(
     {
         **SERVICE_SCHEMA_BASE_FIELDS,
@@ -150,12 +220,10 @@ ACTION_SERVICE_PARAMS = vol.Schema(
     },
     extra=vol.ALLOW_EXTRA,
 )
-ACTION_SERVICE_SCHEMA = vol.All(
-    cv.has_at_least_one_key(ATTR_SERVICE, CONF_ACTION),
-    cv.has_at_most_one_key(ATTR_SERVICE, CONF_ACTION),
-    _rename_legacy_service_key,
-    ACTION_SERVICE_PARAMS,
+ACTION_SERVICE_PARAMS_KEYS = frozenset(
+    key.schema for key in ACTION_SERVICE_PARAMS.schema
 )
+ACTION_SERVICE_SCHEMA = vol.All(_normalize_action_key, ACTION_SERVICE_PARAMS)
 
 ACTIONS_SERVICE_SCHEMA = vol.Schema(
     {
@@ -166,20 +234,120 @@ ACTIONS_SERVICE_SCHEMA = vol.Schema(
 )
 
 
+def _get_service(hass: HomeAssistant, domain: str, service: str) -> Service:
+    """Get service object."""
+    try:
+        # The registry is only read, so its internal (non-copied) view is used.
+        return hass.services.async_services_internal()[domain][service]
+    except KeyError:
+        raise ServiceNotFound(domain, service) from None
+
+
 def _get_entity_component(hass: HomeAssistant, domain: str) -> EntityComponent | None:
     """Get entity component object."""
-    return hass.data.get(DATA_INSTANCES, {}).get(domain)
+    return hass.data.get(DATA_INSTANCES, _NO_ENTITY_COMPONENTS).get(domain)
+
+
+def _get_entity(
+    hass: HomeAssistant,
+    entity_id: str,
+    entity_components: dict[str, EntityComponent | None] | None = None,
+) -> Entity | None:
+    """Get entity object (optionally caching the entity component lookups)."""
+    domain = entity_id.partition(".")[0]
+    if entity_components is None:
+        entity_comp = _get_entity_component(hass, domain)
+    else:
+        if domain not in entity_components:
+            entity_components[domain] = _get_entity_component(hass, domain)
+        entity_comp = entity_components[domain]
+    return entity_comp.get_entity(entity_id) if entity_comp else None
 
 
-def _get_entity(hass: HomeAssistant, entity_id: str) -> Entity | None:
-    """Get entity object."""
-    entity_comp = _get_entity_component(hass, entity_id.split(".")[0])
-    return entity_comp.get_entity(entity_id) if entity_comp else None
+def _normalize_entity_ids(entity_ids: Iterable[Any]) -> set[str]:
+    """Lowercase entity IDs and skip invalid values (same as core's expansion)."""
+    return {
+        entity_id.lower()
+        for entity_id in entity_ids
+        if isinstance(entity_id, str)
+        and entity_id not in (ENTITY_MATCH_NONE, ENTITY_MATCH_ALL)
+    }
+
+
+def _is_native_backoff(node: ast.expr) -> bool:
+    """Check if the expression has the same semantics in Python and Jinja."""
+    match node:
+        case ast.Constant(value=value):
+            return isinstance(value, int | float) and not isinstance(value, bool)
+        case ast.Name(id=name):
+            return name == _BACKOFF_VARIABLE
+        case ast.BinOp(left=left, op=ast.Pow(), right=right):
+            # Jinja's power operator is left-associative (Python's is not).
+            return all(
+                isinstance(operand, ast.Constant | ast.Name)
+                and _is_native_backoff(operand)
+                for operand in (left, right)
+            )
+        case ast.BinOp(left=left, op=op, right=right):
+            return (
+                type(op) in _BACKOFF_OPERATORS
+                and _is_native_backoff(left)
+                and _is_native_backoff(right)
+            )
+    return False
+
+
+def _evaluate_backoff(node: ast.expr, attempt: int) -> Any:
+    """Evaluate a native backoff expression."""
+    match node:
+        case ast.Constant(value=value):
+            return value
+        case ast.Name():
+            return attempt
+        case _:
+            # _is_native_backoff guarantees any other node is a supported BinOp.
+            binop = cast("ast.BinOp", node)
+            return _BACKOFF_OPERATORS[type(binop.op)](
+                _evaluate_backoff(binop.left, attempt),
+                _evaluate_backoff(binop.right, attempt),
+            )
+
+
+def _backoff_function(backoff: Template) -> Callable[[int], float]:
+    """Return a function calculating the delay (in seconds) after an attempt."""
+    # Simple arithmetic of "attempt" (e.g. the default) skips the Jinja rendering.
+    if backoff.is_static:
+        delay = float(backoff.async_render())
+        return lambda _: delay
+    if match := _BACKOFF_EXPRESSION_RE.fullmatch(backoff.template):
+        try:
+            expression = ast.parse(match.group(1).strip(), mode="eval").body
+        except SyntaxError:
+            pass
+        else:
+            if _is_native_backoff(expression):
+                return lambda attempt: float(_evaluate_backoff(expression, attempt))
+    return lambda attempt: float(
+        backoff.async_render(variables={_BACKOFF_VARIABLE: attempt})
+    )
 
 
 class RetryParams:
     """Parse and compute input parameters."""
 
+    __slots__ = (
+        "_entity_components",
+        "_retry_params_str_value",
+        "_service",
+        "backoff",
+        "config_entry",
+        "entities",
+        "expected_numeric_states",
+        "expected_states",
+        "inner_data",
+        "retry_data",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -188,57 +356,90 @@ class RetryParams:
     ) -> None:
         """Initialize the object."""
         self.config_entry = config_entry
+        self._entity_components: dict[str, EntityComponent | None] = {}
         self.retry_data = self._retry_data(hass, data)
-        self.inner_data = self._inner_data(hass, data)
+        self._service = _get_service(
+            hass, self.retry_data[ATTR_DOMAIN], self.retry_data[ATTR_SERVICE]
+        )
+        self.inner_data = self._inner_data(self._service, data)
         self.entities = self._entity_ids(hass)
+        self.backoff = _backoff_function(self.retry_data[ATTR_BACKOFF])
+        self._retry_params_str_value: str | None = None
+        expected_state = self.retry_data.get(ATTR_EXPECTED_STATE, [])
+        self.expected_states = frozenset(expected_state)
+        self.expected_numeric_states = frozenset(
+            value for value in map(_float_or_none, expected_state) if value is not None
+        )
 
     @staticmethod
     def _retry_data(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
         """Compose retry parameters."""
         retry_data: dict[str, Any] = {
-            key: data[key] for key in data if key in SERVICE_SCHEMA_BASE_FIELDS
+            key: data[key] for key in data if key in SERVICE_SCHEMA_BASE_KEYS
         }
         retry_action = data[CONF_ACTION]
-        domain, service = retry_action.lower().split(".")
-        if not hass.services.has_service(domain, service):
-            raise ServiceNotFound(domain, service)
+        if not retry_action.islower():
+            retry_action = retry_action.lower()
+        domain, _, service = retry_action.partition(".")
+        domain, service = sys.intern(domain), sys.intern(service)
         retry_data[ATTR_DOMAIN] = domain
         retry_data[ATTR_SERVICE] = service
+        retry_data[CONF_ACTION] = f"{domain}.{service}"
         for key in [ATTR_BACKOFF, ATTR_VALIDATION]:
             if key in retry_data:
                 retry_data[key] = Template(_fix_template_tokens(retry_data[key]), hass)
         return retry_data
 
-    def _inner_data(self, hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def validate(cls, hass: HomeAssistant, data: dict[str, Any]) -> None:
+        """Validate parameters without resolving the entities."""
+        retry_data = cls._retry_data(hass, data)
+        cls._inner_data(
+            _get_service(hass, retry_data[ATTR_DOMAIN], retry_data[ATTR_SERVICE]),
+            data,
+        )
+
+    @staticmethod
+    def _inner_data(service: Service, data: dict[str, Any]) -> dict[str, Any]:
         """Compose inner action parameters."""
         inner_data = {
             key: value
             for key, value in data.items()
-            if key not in ACTION_SERVICE_PARAMS.schema
+            if key not in ACTION_SERVICE_PARAMS_KEYS
         }
-        domain_services = hass.services.async_services_for_domain(
-            self.retry_data[ATTR_DOMAIN]
-        )
-        if schema := domain_services[self.retry_data[ATTR_SERVICE]].schema:
+        # Validate early so errors are raised to the caller and not in the background.
+        if schema := service.schema:
             schema(inner_data)
         return inner_data
 
-    def _expand_group(self, hass: HomeAssistant, entity_id: str) -> list[str]:
-        """Return group member ids (when a group)."""
-        entity_ids = []
-        entity_obj = _get_entity(hass, entity_id)
-        if (
-            entity_obj is not None
-            and entity_obj.platform is not None
-            and entity_obj.platform.platform_name == GROUP_DOMAIN
-        ):
-            for member_id in getattr(entity_obj, "extra_state_attributes", {}).get(
-                ATTR_ENTITY_ID, []
+    def _expand_groups(
+        self, hass: HomeAssistant, entity_ids: Iterable[str]
+    ) -> list[str]:
+        """Return entity ids with group entities replaced by their members."""
+        expanded = []
+        visited = set()
+        stack = list(entity_ids)
+        while stack:
+            entity_id = stack.pop()
+            if entity_id in visited:
+                continue
+            visited.add(entity_id)
+            entity_obj = _get_entity(hass, entity_id, self._entity_components)
+            if (
+                entity_obj is not None
+                and entity_obj.platform is not None
+                and entity_obj.platform.platform_name == GROUP_DOMAIN
             ):
-                entity_ids.extend(self._expand_group(hass, member_id))
-        else:
-            entity_ids.append(entity_id)
-        return entity_ids
+                stack.extend(
+                    reversed(
+                        getattr(entity_obj, "extra_state_attributes", {}).get(
+                            ATTR_ENTITY_ID, []
+                        )
+                    )
+                )
+            else:
+                expanded.append(entity_id)
+        return expanded
 
     def _entity_ids(self, hass: HomeAssistant) -> list[str]:
         """Extract and expand entity ids."""
@@ -250,7 +451,17 @@ class RetryParams:
                 entity.entity_id
                 for entity in (entity_comp.entities if entity_comp else [])
             ]
-        entity_ids = []
+        selectors = ENTITY_SERVICE_FIELDS.intersection(self.inner_data)
+        if not selectors:
+            return []
+        if selectors == {ATTR_ENTITY_ID}:
+            # Plain entity IDs (the common case) don't require the registries.
+            entity_ids = self.inner_data[ATTR_ENTITY_ID]
+            if entity_ids in (None, ENTITY_MATCH_NONE):
+                return []
+            return self._expand_groups(
+                hass, _normalize_entity_ids(cv.ensure_list(entity_ids))
+            )
         params = {
             "domain": self.retry_data[ATTR_DOMAIN],
             "service": self.retry_data[ATTR_SERVICE],
@@ -258,18 +469,83 @@ class RetryParams:
         }
         if "hass" in ServiceCall.__slots__:
             params["hass"] = hass
+        # Groups are expanded by _expand_groups, which is guarded against cycles.
         entities = async_extract_referenced_entity_ids(
+            hass, ServiceCall(**params), expand_group=False
+        )
+        return self._expand_groups(
             hass,
-            ServiceCall(**params),
+            _normalize_entity_ids(entities.referenced | entities.indirectly_referenced),
         )
-        for entity_id in entities.referenced | entities.indirectly_referenced:
-            entity_ids.extend(self._expand_group(hass, entity_id))
-        return entity_ids
+
+    @property
+    def retry_params_str(self) -> str:
+        """Return a string with the (non default) retry parameters."""
+        if self._retry_params_str_value is None:
+            self._retry_params_str_value = self._compose_retry_params_str()
+        return self._retry_params_str_value
+
+    def _compose_retry_params_str(self) -> str:
+        """Compose the retry parameters string (shared by all entities)."""
+        retry_params = []
+        if (expected_state := self.retry_data.get(ATTR_EXPECTED_STATE)) is not None:
+            if len(expected_state) == 1:
+                retry_params.append(f"expected_state={expected_state[0]}")
+            else:
+                retry_params.append(
+                    f"expected_state in ({
+                        ', '.join(state for state in expected_state)
+                    })"
+                )
+        for name, value, default in (
+            (
+                ATTR_BACKOFF,
+                self.retry_data[ATTR_BACKOFF].template,
+                DEFAULT_BACKOFF,
+            ),
+            (
+                ATTR_VALIDATION,
+                self.retry_data[ATTR_VALIDATION].template
+                if ATTR_VALIDATION in self.retry_data
+                else None,
+                None,
+            ),
+            (ATTR_STATE_DELAY, self.retry_data[ATTR_STATE_DELAY], 0),
+            (
+                ATTR_STATE_GRACE,
+                self.retry_data[ATTR_STATE_GRACE],
+                DEFAULT_STATE_GRACE,
+            ),
+            (
+                ATTR_RETRY_ID,
+                self.retry_data.get(ATTR_RETRY_ID),
+                None if ATTR_RETRY_ID not in self.retry_data else "add",
+            ),
+        ):
+            if value != default:
+                if isinstance(value, str):
+                    retry_params.append(f'{name}="{value}"')
+                else:
+                    retry_params.append(f"{name}={value}")
+        return f"[{', '.join(retry_params)}]" if len(retry_params) > 0 else ""
 
 
 class RetryAction:
     """Perform an action with retries on failures."""
 
+    __slots__ = (
+        "_action_str_value",
+        "_attempt",
+        "_context",
+        "_entity_id",
+        "_hass",
+        "_inner_data",
+        "_needs_validation",
+        "_params",
+        "_retry_id",
+        "_validation_variables",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -280,15 +556,15 @@ class RetryAction:
         """Initialize the object."""
         self._hass = hass
         self._params = params
-        self._inner_data = params.inner_data.copy()
+        # The inner data is read-only and can be shared when there is no entity.
+        self._inner_data = params.inner_data
         if entity_id:
-            for key in cv.ENTITY_SERVICE_FIELDS:
-                if key in self._inner_data:
-                    del self._inner_data[key]
-            self._inner_data = {
-                ATTR_ENTITY_ID: entity_id,
-                **self._inner_data,
-            }
+            self._inner_data = {ATTR_ENTITY_ID: entity_id}
+            self._inner_data.update(
+                (key, value)
+                for key, value in params.inner_data.items()
+                if key not in ENTITY_SERVICE_FIELDS
+            )
         self._entity_id = entity_id
         self._context = context
         self._attempt = 1
@@ -297,11 +573,17 @@ class RetryAction:
             if self._entity_id:
                 self._retry_id = self._entity_id
             else:
-                self._retry_id = (
-                    f"{params.retry_data[ATTR_DOMAIN]}."
-                    + params.retry_data[ATTR_SERVICE]
-                )
+                self._retry_id = params.retry_data[CONF_ACTION]
         self._action_str_value = None
+        self._validation_variables = (
+            {"entity_id": self._entity_id} if self._entity_id else None
+        )
+        # Expected state is checked only for an entity.
+        self._needs_validation = bool(
+            self._entity_id
+            or ATTR_VALIDATION in params.retry_data
+            or params.retry_data[ATTR_STATE_DELAY] > 0
+        )
         self._start_id()
 
     async def _async_validate(self) -> None:
@@ -335,15 +617,12 @@ class RetryAction:
         """Check if the entity's state is expected."""
         if not entity or ATTR_EXPECTED_STATE not in self._params.retry_data:
             return True
-        for expected in self._params.retry_data[ATTR_EXPECTED_STATE]:
-            if entity.state == expected:
-                return True
-            try:
-                if float(entity.state) == float(expected):  # type: ignore[reportArgumentType]
-                    return True
-            except ValueError:
-                pass
-        return False
+        if entity.state in self._params.expected_states:
+            return True
+        if not self._params.expected_numeric_states:
+            return False
+        state = _float_or_none(entity.state)
+        return state is not None and state in self._params.expected_numeric_states
 
     def _check_validation(self) -> bool:
         """Check if the validation statement is true."""
@@ -351,7 +630,7 @@ class RetryAction:
             return True
         return result_as_boolean(
             self._params.retry_data[ATTR_VALIDATION].async_render(
-                variables={"entity_id": self._entity_id} if self._entity_id else None
+                variables=self._validation_variables
             )
         )
 
@@ -370,54 +649,12 @@ class RetryAction:
                 ', '.join([f'{key}={value}' for key, value in self._inner_data.items()])
             })"
         )
-        retry_params = []
-        if (
-            expected_state := self._params.retry_data.get(ATTR_EXPECTED_STATE)
-        ) is not None:
-            if len(expected_state) == 1:
-                retry_params.append(f"expected_state={expected_state[0]}")
-            else:
-                retry_params.append(
-                    f"expected_state in ({
-                        ', '.join(state for state in expected_state)
-                    })"
-                )
-        for name, value, default in (
-            (
-                ATTR_BACKOFF,
-                self._params.retry_data[ATTR_BACKOFF].template,
-                DEFAULT_BACKOFF,
-            ),
-            (
-                ATTR_VALIDATION,
-                self._params.retry_data[ATTR_VALIDATION].template
-                if ATTR_VALIDATION in self._params.retry_data
-                else None,
-                None,
-            ),
-            (ATTR_STATE_DELAY, self._params.retry_data[ATTR_STATE_DELAY], 0),
-            (
-                ATTR_STATE_GRACE,
-                self._params.retry_data[ATTR_STATE_GRACE],
-                DEFAULT_STATE_GRACE,
-            ),
-            (
-                ATTR_RETRY_ID,
-                self._params.retry_data.get(ATTR_RETRY_ID),
-                None if ATTR_RETRY_ID not in self._params.retry_data else "add",
-            ),
-        ):
-            if value != default:
-                if isinstance(value, str):
-                    retry_params.append(f'{name}="{value}"')
-                else:
-                    retry_params.append(f"{name}={value}")
-        if len(retry_params) > 0:
-            service_call += f"[{', '.join(retry_params)}]"
-        return service_call
+        return service_call + self._params.retry_params_str
 
     def _log(self, level: int, prefix: str, stack_info: bool = False) -> None:  # noqa: FBT001, FBT002
         """Log entry."""
+        if not LOGGER.isEnabledFor(level):
+            return
         LOGGER.log(
             level,
             "[%s]: attempt %d/%d: %s",
@@ -449,22 +686,20 @@ class RetryAction:
         """Add or override self as the retry ID running job."""
         if not self._retry_id:
             return
-        with _running_retries_write_lock:
-            self._set_id(
-                1 if not self._check_id() else _running_retries[self._retry_id][1] + 1
-            )
+        self._set_id(
+            1 if not self._check_id() else _running_retries[self._retry_id][1] + 1
+        )
 
     def _end_id(self) -> None:
         """Remove self from being the retry ID running job."""
         if not self._retry_id:
             return
-        with _running_retries_write_lock:
-            if self._check_id():
-                count = _running_retries[self._retry_id][1] - 1
-                if not count:
-                    del _running_retries[self._retry_id]
-                else:
-                    self._set_id(count)
+        if self._check_id():
+            count = _running_retries[self._retry_id][1] - 1
+            if not count:
+                del _running_retries[self._retry_id]
+            else:
+                self._set_id(count)
 
     def _set_id(self, count: int) -> None:
         """Set the retry_id entry with a counter."""
@@ -475,7 +710,7 @@ class RetryAction:
         """Check if self is the retry ID running job."""
         return (
             not self._retry_id
-            or _running_retries.get(self._retry_id, [None])[0] == self._context.id
+            or _running_retries.get(self._retry_id, _NOT_RUNNING)[0] == self._context.id
         )
 
     @callback
@@ -488,11 +723,14 @@ class RetryAction:
             await self._hass.services.async_call(
                 self._params.retry_data[ATTR_DOMAIN],
                 self._params.retry_data[ATTR_SERVICE],
+                # A private copy per attempt is required: the dict is handed over
+                # as-is to the EVENT_CALL_SERVICE event (and updated with "target").
                 self._inner_data.copy(),
                 blocking=True,
                 context=Context(self._context.user_id, self._context.id),
             )
-            await self._async_validate()
+            if self._needs_validation:
+                await self._async_validate()
             self._log(
                 logging.DEBUG if self._attempt == 1 else logging.INFO, "Succeeded"
             )
@@ -524,65 +762,61 @@ class RetryAction:
                         context=Context(self._context.user_id, self._context.id),
                     )
                 return
-            next_retry = dt_util.now() + datetime.timedelta(
-                seconds=float(
-                    self._params.retry_data[ATTR_BACKOFF].async_render(
-                        variables={"attempt": self._attempt - 1}
-                    )
-                )
-            )
+            delay = self._params.backoff(self._attempt - 1)
             self._attempt += 1
-            event.async_track_point_in_time(self._hass, self.async_retry, next_retry)
+            event.async_call_later(self._hass, delay, self.async_retry)
 
 
-def _wrap_actions(  # noqa: PLR0912
+def _wrap_actions(
     hass: HomeAssistant, sequence: list[dict], retry_params: dict[str, Any]
 ) -> None:
     """Warp any action with retry."""
-    for action in sequence:
-        action_type = cv.determine_script_action(action)
-        match action_type:
-            case cv.SCRIPT_ACTION_CALL_SERVICE:
-                domain_service = (
-                    action[CONF_ACTION]
-                    if CONF_ACTION in action
-                    else action[ATTR_SERVICE]
-                )
-                if domain_service == f"{DOMAIN}.{ACTIONS_SERVICE}":
-                    message = "Nested retry.actions are disallowed"
-                    raise IntegrationError(message)
-                if domain_service in [
-                    f"{DOMAIN}.{ACTION_SERVICE}",
-                    f"{DOMAIN}.{CALL_SERVICE}",
-                ]:
-                    message = f"{domain_service} inside retry.actions is disallowed"
-                    raise IntegrationError(message)
-                action[CONF_SERVICE_DATA] = action.get(CONF_SERVICE_DATA, {})
-                action[CONF_SERVICE_DATA][CONF_ACTION] = domain_service
-                action[CONF_SERVICE_DATA].update(retry_params)
-                action[CONF_ACTION] = f"{DOMAIN}.{ACTION_SERVICE}"
-                # Validate parameters so errors are not raised in the background.
-                RetryParams(
-                    hass,
-                    None,
-                    {**action[CONF_SERVICE_DATA], **action.get(CONF_TARGET, {})},
-                )
-            case cv.SCRIPT_ACTION_REPEAT:
-                _wrap_actions(hass, action[CONF_REPEAT][CONF_SEQUENCE], retry_params)
-            case cv.SCRIPT_ACTION_CHOOSE:
-                for choose in action[CONF_CHOOSE]:
-                    _wrap_actions(hass, choose[CONF_SEQUENCE], retry_params)
-                if CONF_DEFAULT in action:
-                    _wrap_actions(hass, action[CONF_DEFAULT], retry_params)
-            case cv.SCRIPT_ACTION_IF:
-                _wrap_actions(hass, action[CONF_THEN], retry_params)
-                if CONF_ELSE in action:
-                    _wrap_actions(hass, action[CONF_ELSE], retry_params)
-            case cv.SCRIPT_ACTION_PARALLEL:
-                for parallel in action[CONF_PARALLEL]:
-                    _wrap_actions(hass, parallel[CONF_SEQUENCE], retry_params)
-            case cv.SCRIPT_ACTION_SEQUENCE:
-                _wrap_actions(hass, action[CONF_SEQUENCE], retry_params)
+    determine_script_action = cv.determine_script_action
+    sequences = deque([sequence])
+    while sequences:
+        for action in sequences.popleft():
+            action_type = determine_script_action(action)
+            match action_type:
+                case cv.SCRIPT_ACTION_CALL_SERVICE:
+                    domain_service = (
+                        action[CONF_ACTION]
+                        if CONF_ACTION in action
+                        else action[ATTR_SERVICE]
+                    )
+                    if domain_service == DOMAIN_ACTIONS_SERVICE:
+                        message = "Nested retry.actions are disallowed"
+                        raise IntegrationError(message)
+                    if domain_service in DISALLOWED_INNER_SERVICES:
+                        message = f"{domain_service} inside retry.actions is disallowed"
+                        raise IntegrationError(message)
+                    action[CONF_SERVICE_DATA] = action.get(CONF_SERVICE_DATA, {})
+                    action[CONF_SERVICE_DATA][CONF_ACTION] = domain_service
+                    action[CONF_SERVICE_DATA].update(retry_params)
+                    action[CONF_ACTION] = DOMAIN_ACTION_SERVICE
+                    # Validate parameters so errors are not raised in the background.
+                    # The entities are resolved only when the action is performed.
+                    RetryParams.validate(
+                        hass,
+                        {**action[CONF_SERVICE_DATA], **action.get(CONF_TARGET, {})},
+                    )
+                case cv.SCRIPT_ACTION_REPEAT:
+                    sequences.append(action[CONF_REPEAT][CONF_SEQUENCE])
+                case cv.SCRIPT_ACTION_CHOOSE:
+                    sequences.extend(
+                        choose[CONF_SEQUENCE] for choose in action[CONF_CHOOSE]
+                    )
+                    if CONF_DEFAULT in action:
+                        sequences.append(action[CONF_DEFAULT])
+                case cv.SCRIPT_ACTION_IF:
+                    sequences.append(action[CONF_THEN])
+                    if CONF_ELSE in action:
+                        sequences.append(action[CONF_ELSE])
+                case cv.SCRIPT_ACTION_PARALLEL:
+                    sequences.extend(
+                        parallel[CONF_SEQUENCE] for parallel in action[CONF_PARALLEL]
+                    )
+                case cv.SCRIPT_ACTION_SEQUENCE:
+                    sequences.append(action[CONF_SEQUENCE])
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -622,7 +856,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         retry_params: dict[str, Any] = {
             key: service_call.data[key]
             for key in service_call.data
-            if key in SERVICE_SCHEMA_BASE_FIELDS
+            if key in SERVICE_SCHEMA_BASE_KEYS
         }
         _wrap_actions(hass, sequence, retry_params)
         await script.Script(hass, sequence, ACTIONS_SERVICE, DOMAIN).async_run(
@@ -18,6 +18,12 @@ if TYPE_CHECKING:
 
 from .const import CONF_DISABLE_REPAIR, DOMAIN
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DISABLE_REPAIR, default=False): selector.BooleanSelector(),
+    }
+)
+
 
 class RetryConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow."""
@@ -26,7 +32,7 @@ class RetryConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle a flow initialized by the user."""
-        if self._async_current_entries():
+        if self.hass.config_entries.async_entries(DOMAIN, include_ignore=False):
             return self.async_abort(reason="single_instance_allowed")
 
         if user_input is None:
@@ -67,14 +73,7 @@ class OptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_DISABLE_REPAIR,
-                        default=self._config_entry.options.get(
-                            CONF_DISABLE_REPAIR, False
-                        ),
-                    ): selector.BooleanSelector(),
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self._config_entry.options
             ),
         )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+import logging
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, Mock
 
@@ -51,6 +52,11 @@ from pytest_homeassistant_custom_component.common import (
     async_fire_time_changed,
 )
 
+from custom_components.retry import (
+    ACTION_SERVICE_SCHEMA,
+    _fix_template_tokens,
+    _float_or_none,
+)
 from custom_components.retry.const import (
     ACTION_SERVICE,
     ACTIONS_SERVICE,
@@ -235,6 +241,52 @@ async def test_selective_retry(
     assert ATTR_DEVICE_ID not in calls[0].data
 
 
+async def test_entity_id_none(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test 'none' entity ID calls the inner action once without an entity."""
+    calls = await async_setup(hass, raises=False)
+    await async_call(
+        hass, {ATTR_ENTITY_ID: ENTITY_MATCH_NONE, ATTR_EXPECTED_STATE: "on"}
+    )
+    await async_shutdown(hass, freezer)
+    assert len(calls) == 1
+    assert calls[0].data[ATTR_ENTITY_ID] == ENTITY_MATCH_NONE
+
+
+@pytest.mark.parametrize(
+    ("action", "entity_id", "called_entities"),
+    [
+        (TEST_SERVICE, "Binary_Sensor.Test", [["binary_sensor.test"]]),
+        (
+            TEST_SERVICE,
+            "binary_sensor.test, binary_sensor.test2",
+            [["binary_sensor.test", "binary_sensor.test2"]] * 7,
+        ),
+        (TEST_ON_ERROR_SERVICE, [ENTITY_MATCH_NONE], [[ENTITY_MATCH_NONE]]),
+    ],
+    ids=["mixed case", "csv string is a single id", "none in list"],
+)
+async def test_entity_ids_normalization(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    action: str,
+    entity_id: str | list[str],
+    called_entities: list[list[str]],
+) -> None:
+    """Test entity IDs are normalized the same as core's target extraction."""
+    calls = await async_setup(hass, raises=False)
+    await hass.services.async_call(
+        DOMAIN,
+        ACTION_SERVICE,
+        {CONF_ACTION: f"{DOMAIN}.{action}", ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    await async_shutdown(hass, freezer)
+    assert [x.data[ATTR_ENTITY_ID] for x in calls] == called_entities
+
+
 @pytest.mark.parametrize(
     ("expected_state", "validation", "grace"),
     [
@@ -306,8 +358,10 @@ async def test_state_delay(
 async def test_entity_expected_state_list(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test list of expected states."""
+    caplog.set_level(logging.DEBUG)
     calls = await async_setup(hass, raises=False)
     await async_call(
         hass,
@@ -318,6 +372,10 @@ async def test_entity_expected_state_list(
     )
     await async_shutdown(hass, freezer)
     assert len(calls) == 1
+    assert (
+        f"[Succeeded]: attempt 1/7: {DOMAIN}.{TEST_SERVICE}"
+        "(entity_id=binary_sensor.test)[expected_state in (dummy, on)]"
+    ) in caplog.text
 
 
 async def test_validation_success(
@@ -365,6 +423,19 @@ async def test_float_point_zero(
     assert len(calls) == 1
 
 
+@pytest.mark.parametrize(
+    "value",
+    ["1_000", " 5 ", "inf", "1e3", "on", "\x1c1", 5, 1.5, None],
+)
+async def test_float_or_none(value: str | float | None) -> None:
+    """Test number parsing is aligned with float()."""
+    try:
+        expected = float(value)  # type: ignore[reportArgumentType]
+    except (TypeError, ValueError):
+        expected = None
+    assert _float_or_none(value) == expected
+
+
 async def test_retry_id_cancellation(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -597,6 +668,37 @@ async def test_group_platform_entity_unavailable(
     assert f"{entity} is not available" in caplog.text
 
 
+@pytest.mark.parametrize(
+    "data",
+    [{}, {ATTR_DEVICE_ID: ENTITY_MATCH_NONE}],
+    ids=["entity ids", "with device id"],
+)
+async def test_group_cycle(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+    data: dict[str, Any],
+) -> None:
+    """Test groups referencing each other are expanded once."""
+    entity = "light.invalid"
+    calls = await async_setup(hass, raises=False)
+    assert await async_setup_component(
+        hass,
+        "group",
+        {
+            "group": {
+                "test1": {CONF_ENTITIES: [entity, "group.test2"]},
+                "test2": {CONF_ENTITIES: ["group.test1", entity]},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    await async_call(hass, {ATTR_ENTITY_ID: ["group.test1", "group.test2"], **data})
+    await async_shutdown(hass, freezer)
+    assert [x.data[ATTR_ENTITY_ID] for x in calls] == [[entity]] * 7
+    assert f"{entity} is not available" in caplog.text
+
+
 async def test_template(hass: HomeAssistant) -> None:
     """Test retry_service with template."""
     calls = await async_setup(hass, raises=False)
@@ -610,6 +712,33 @@ async def test_template(hass: HomeAssistant) -> None:
     assert len(calls) == 1
 
 
+@pytest.mark.parametrize(
+    ("value", "fixed"),
+    [
+        ("[# Test #][[ 1 ]]", "{# Test #}{{ 1 }}"),
+        ("[% if true %]][% endif %]", "{% if true %}]{% endif %}"),
+        ("[# Test #]]", "{# Test #}]"),
+    ],
+    ids=["tokens", "statement end before bracket", "comment end before bracket"],
+)
+async def test_fix_template_tokens(value: str, fixed: str) -> None:
+    """Test tokens are replaced left to right (also when overlapping)."""
+    assert _fix_template_tokens(value) == fixed
+
+
+async def test_mixed_case_action(hass: HomeAssistant) -> None:
+    """Test action name is case insensitive."""
+    calls = await async_setup(hass, raises=False)
+    await hass.services.async_call(
+        DOMAIN,
+        ACTION_SERVICE,
+        {CONF_ACTION: f"{DOMAIN.title()}.{TEST_SERVICE.title()}"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert [(call.domain, call.service) for call in calls] == [(DOMAIN, TEST_SERVICE)]
+
+
 async def test_invalid_service(hass: HomeAssistant) -> None:
     """Test invalid service."""
     await async_setup(hass)
@@ -958,8 +1087,36 @@ async def test_actions_propagating_args(
             "{{ 10 * 2 ** attempt }}",
             [10, 20, 40, 80, 160, 320],
         ),
+        (
+            "[[ (attempt + 1) | int ]]",
+            "{{ (attempt + 1) | int }}",
+            [1, 2, 3, 4, 5, 6],
+        ),
+        (
+            "[[ 2 ** 2 ** attempt ]]",
+            "{{ 2 ** 2 ** attempt }}",
+            [1, 4, 16, 64, 256, 1024],
+        ),
+        (
+            "[[ -attempt + 10 ]]",
+            "{{ -attempt + 10 }}",
+            [10, 9, 8, 7, 6, 5],
+        ),
+        (
+            "[[ (attempt ~ 1) | int ]]",
+            "{{ (attempt ~ 1) | int }}",
+            [1, 11, 21, 31, 41, 51],
+        ),
+    ],
+    ids=[
+        "default - exponential backoff",
+        "linear",
+        "slow exponential backoff",
+        "rendered backoff",
+        "chained power (left-associative in Jinja)",
+        "unary minus",
+        "not a python expression",
     ],
-    ids=["default - exponential backoff", "linear", "slow exponential backoff"],
 )
 async def test_actions_backoff(  # noqa: PLR0913
     hass: HomeAssistant,
@@ -1279,6 +1436,13 @@ async def test_no_action_and_no_service_key_call(
     assert exception.value.msg == "must contain at least one of service, action."
 
 
+async def test_action_schema_not_dictionary() -> None:
+    """Test action schema rejects a non dictionary value."""
+    with pytest.raises(vol.Invalid) as exception:
+        ACTION_SERVICE_SCHEMA(f"{DOMAIN}.{TEST_SERVICE}")
+    assert exception.value.msg == "expected dictionary"
+
+
 async def test_legacy_service_key_actions(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,